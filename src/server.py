@@ -8,21 +8,62 @@ Supports both local (stdio) and remote (streamable-http) transport modes.
 """
 
 import argparse
+import asyncio
+import functools
+import logging
+import time
+from collections import OrderedDict
 from enum import Enum
 from datetime import datetime
-from typing import Optional
+from types import ModuleType
+from typing import Any, Awaitable, AsyncIterator, Callable, Hashable, Literal, Optional, TypeVar
 
+import pydantic_core
 from fastmcp import FastMCP
 from pydantic import BaseModel, Field
-import redditwarp.SYNC
-import redditwarp.models.submission_SYNC
+
+
+logger = logging.getLogger(__name__)
+
+
+def _serialize_result(data: Any) -> str:
+    """Serialize tool results as compact JSON (FastMCP's default pretty-prints with indent=2)."""
+    return pydantic_core.to_json(data, fallback=str).decode()
 
 
 # Initialize FastMCP server with stateless HTTP support for remote deployment
-mcp = FastMCP("Reddit MCP Server", stateless_http=True)
+mcp = FastMCP("Reddit MCP Server", stateless_http=True, tool_serializer=_serialize_result)
+
+# Maximum number of in-flight requests to Reddit
+MAX_CONCURRENT_REQUESTS = 64
+
+# Retry policy for rate-limited (429) and server error (5xx) responses
+MAX_RETRIES = 3
+RETRY_BACKOFF_SECONDS = 0.5
+
+# Short-lived cache for subreddit info and listings; comments are too volatile for it,
+# and are only held briefly when prefetched (see PREFETCH_TTL_SECONDS)
+CACHE_MAXSIZE = 512
+CACHE_TTL_SECONDS = 30
+
+# Comment tree size the comment tools fetch when the caller doesn't say
+DEFAULT_COMMENT_LIMIT = 10
+DEFAULT_COMMENT_DEPTH = 3
+
+# Number of top posts in a freshly fetched listing whose comment trees are loaded in the
+# background, ready for the usual follow-up call. Enabled by main() for streamable-http
+# only: stdio sessions have too little think-time between calls to benefit.
+PREFETCH_TOP_POSTS = 3
+PREFETCH_ENABLED = False
+# Prefetched comment trees are discarded unused after this long, as comments change quickly
+PREFETCH_TTL_SECONDS = 5
+
+
+T = TypeVar('T')
 
 
 # Pydantic Models
+# These document the shape of tool responses; RedditServer builds matching dicts directly.
 class PostType(str, Enum):
     """Types of Reddit posts."""
     LINK = "link"
@@ -65,12 +106,13 @@ class Post(BaseModel):
 
 
 class Comment(BaseModel):
-    """A Reddit comment with recursive replies."""
+    """A Reddit comment, linked to its parent comment rather than nesting replies."""
     id: str
+    parent_id: Optional[str]
+    depth: int
     author: str
     body: str
     score: int
-    replies: list['Comment'] = []
 
 
 class Moderator(BaseModel):
@@ -84,160 +126,357 @@ class PostDetail(BaseModel):
     comments: list[Comment]
 
 
+# Post type and content extractor for submission classes RedditServer doesn't recognise
+_UNKNOWN_SUBMISSION: tuple[PostType, Callable[[Any], Optional[str]]] = (PostType.UNKNOWN, lambda s: None)
+
+
+class TTLCache:
+    """Least-recently-used cache whose entries expire after a fixed time-to-live.
+    
+    Only touched from the event loop, so no locking is needed.
+    """
+    
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+    
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+    
+    def pop(self, key: Hashable) -> Optional[Any]:
+        """Remove and return the value for key, or None if missing or expired."""
+        entry = self._entries.pop(key, None)
+        if entry is None or entry[0] <= time.monotonic():
+            return None
+        return entry[1]
+    
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value under key, evicting the least recently used entries over maxsize."""
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+
+class PooledHttpxTransport(ModuleType):
+    """redditwarp transport adapter with an httpx pool sized to the concurrency cap.
+    
+    httpx keeps only 20 idle connections by default, while the semaphore lets up to
+    MAX_CONCURRENT_REQUESTS requests run at once. redditwarp registers its adapters
+    as modules, hence the ModuleType base.
+    """
+    
+    def new_connector(self):
+        import httpx
+        from redditwarp.http.transport.impls.httpx_ASYNC import HttpxConnector
+
+        limits = httpx.Limits(max_connections=None, max_keepalive_connections=MAX_CONCURRENT_REQUESTS)
+        return HttpxConnector(httpx.AsyncClient(limits=limits))
+
+
 class RedditServer:
     """Reddit API wrapper using redditwarp for accessing Reddit's public API."""
     
     def __init__(self):
-        """Initialize Reddit client."""
-        self.client = redditwarp.SYNC.Client()
-    
-    def _get_post_type(self, submission) -> PostType:
-        """Determine post type from submission object using redditwarp types."""
-        if isinstance(submission, redditwarp.models.submission_SYNC.LinkPost):
-            return PostType.LINK
-        elif isinstance(submission, redditwarp.models.submission_SYNC.TextPost):
-            return PostType.TEXT
-        elif isinstance(submission, redditwarp.models.submission_SYNC.GalleryPost):
-            return PostType.GALLERY
-        return PostType.UNKNOWN
-    
-    def _get_post_content(self, submission) -> Optional[str]:
-        """Extract content from submission based on post type."""
-        if isinstance(submission, redditwarp.models.submission_SYNC.LinkPost):
-            return submission.permalink
-        elif isinstance(submission, redditwarp.models.submission_SYNC.TextPost):
-            return submission.body
-        elif isinstance(submission, redditwarp.models.submission_SYNC.GalleryPost):
-            return str(submission.gallery_link)
-        return None
-    
-    def _build_post(self, submission) -> Post:
-        """Convert redditwarp submission to Post model."""
-        return Post(
-            id=submission.id36,
-            title=submission.title,
-            author=submission.author_display_name or '[deleted]',
-            score=submission.score,
-            subreddit=submission.subreddit.name,
-            url=submission.permalink,
-            created_at=submission.created_at.astimezone().isoformat(),
-            comment_count=submission.comment_count,
-            post_type=self._get_post_type(submission),
-            content=self._get_post_content(submission)
-        )
-    
-    def _build_comment_tree(self, node, depth: int = 3) -> Optional[Comment]:
-        """Recursively build comment tree with depth limit."""
-        if depth <= 0 or not node:
-            return None
+        """Initialize Reddit client.
+        
+        redditwarp is imported here rather than at module level, so stdio sessions
+        that never call a tool don't pay for it at startup.
+        """
+        import redditwarp.ASYNC
+        import redditwarp.models.submission_ASYNC as submission_models
+        from redditwarp.http.exceptions import StatusCodeException
+
+        self.client = redditwarp.ASYNC.Client()
+        self._status_code_exception = StatusCodeException
+        # Post type and content extractor for each redditwarp submission class, looked up
+        # by exact type (redditwarp's submission classes don't subclass one another)
+        self._submission_dispatch: dict[type, tuple[PostType, Callable[[Any], Optional[str]]]] = {
+            submission_models.LinkPost: (PostType.LINK, lambda s: s.permalink),
+            submission_models.TextPost: (PostType.TEXT, lambda s: s.body),
+            submission_models.GalleryPost: (PostType.GALLERY, lambda s: str(s.gallery_link)),
+        }
+        self._semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        self._cache = TTLCache(CACHE_MAXSIZE, CACHE_TTL_SECONDS)
+        self._inflight: dict[Hashable, asyncio.Task] = {}
+        # Prefetched comment trees are handed out once, so they never serve stale repeats.
+        # Running prefetches wait in _prefetching and only start their TTL once finished,
+        # so a slow one is waited on rather than fetched a second time.
+        self._prefetching: dict[Hashable, asyncio.Task] = {}
+        self._prefetched = TTLCache(CACHE_MAXSIZE, PREFETCH_TTL_SECONDS)
+    
+    async def _request(self, call: Callable[[], Awaitable[T]]) -> T:
+        """Run a Reddit API call under the concurrency cap, backing off on 429/5xx.
+        
+        Header-driven rate limiting (X-Ratelimit-*) is already applied by redditwarp's
+        HTTP client; this only retries responses Reddit asks us to try again later.
+        """
+        attempt = 0
+        while True:
+            try:
+                async with self._semaphore:
+                    return await call()
+            except self._status_code_exception as e:
+                retryable = e.status_code == 429 or e.status_code >= 500
+                if not retryable or attempt >= MAX_RETRIES:
+                    raise
+            await asyncio.sleep(RETRY_BACKOFF_SECONDS * 2 ** attempt)
+            attempt += 1
+    
+    async def _single_flight(self, key: Hashable, fetch: Callable[[], Awaitable[T]]) -> T:
+        """Return the cached value for key, fetching it at most once at a time.
+        
+        Concurrent callers for the same key share the first caller's fetch, which
+        caches its result for later callers.
+        """
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+        task = self._inflight.get(key)
+        if task is None:
+            async def fetch_and_cache() -> T:
+                value = await fetch()
+                self._cache.set(key, value)
+                return value
+
+            task = asyncio.create_task(fetch_and_cache())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shielded so one cancelled caller doesn't cancel the fetch for everyone else
+        return await asyncio.shield(task)
+    
+    async def _get_posts(self, key: tuple, pull: Callable[[], AsyncIterator]) -> list[dict]:
+        """Return post dicts from a listing, cached and shared between callers under key."""
+        return await self._single_flight(key, lambda: self._fetch_posts(pull))
+    
+    async def _fetch_posts(self, pull: Callable[[], AsyncIterator]) -> list[dict]:
+        """Fetch a listing from Reddit, retrying it as a whole, and prefetch its top comments."""
+        async def collect() -> list[dict]:
+            posts = []
+            async for subm in pull():
+                posts.append(self._build_post_dict(subm))
+            return posts
 
-        comment = node.value
-        replies = []
-        for child in node.children:
-            child_comment = self._build_comment_tree(child, depth - 1)
-            if child_comment:
-                replies.append(child_comment)
-
-        return Comment(
-            id=comment.id36,
-            author=comment.author_display_name or '[deleted]',
-            body=comment.body,
-            score=comment.score,
-            replies=replies
-        )
-    
-    def get_frontpage_posts(self, limit: int = 10) -> list[Post]:
+        posts = await self._request(collect)
+        self._prefetch_comments(posts)
+        return posts
+    
+    def _prefetch_comments(self, posts: list[dict]) -> None:
+        """Start loading comment trees for the top posts of a listing in the background.
+        
+        Trees are fetched with the tools' default limit and depth, which is what a
+        follow-up get_post_content or get_post_comments call asks for.
+        """
+        if not PREFETCH_ENABLED:
+            return
+        limit, depth = DEFAULT_COMMENT_LIMIT, DEFAULT_COMMENT_DEPTH
+        for post in posts[:PREFETCH_TOP_POSTS]:
+            key = ("comments", post["id"], limit, depth)
+            if key not in self._prefetching and self._prefetched.get(key) is None:
+                task = asyncio.create_task(self._fetch_comments_quietly(post["id"], limit, depth))
+                self._prefetching[key] = task
+                task.add_done_callback(functools.partial(self._store_prefetched, key))
+    
+    def _store_prefetched(self, key: Hashable, task: asyncio.Task) -> None:
+        """Move a finished prefetch into the TTL cache, unless a caller already claimed it."""
+        if self._prefetching.get(key) is not task:
+            return
+        del self._prefetching[key]
+        if not task.cancelled() and task.result() is not None:
+            self._prefetched.set(key, task.result())
+    
+    async def _fetch_comments_quietly(self, post_id: str, limit: int, depth: int) -> Optional[list[dict]]:
+        """Fetch a comment tree for prefetching, returning None on failure.
+        
+        A failed prefetch is not an error: it is logged, and the follow-up call simply
+        fetches the tree again.
+        """
+        try:
+            return await self._fetch_comments(post_id, limit, depth)
+        except Exception as e:
+            logger.warning("Prefetch of comments for %s failed: %s", post_id, e)
+            return None
+    
+    def _build_post_dict(self, submission) -> dict:
+        """Convert redditwarp submission to a dict shaped like the Post model."""
+        post_type, get_content = self._submission_dispatch.get(type(submission), _UNKNOWN_SUBMISSION)
+        return {
+            "id": submission.id36,
+            "title": submission.title,
+            "author": submission.author_display_name or '[deleted]',
+            "score": submission.score,
+            "subreddit": submission.subreddit.name,
+            "url": submission.permalink,
+            "created_at": submission.created_at.astimezone().isoformat(),
+            "comment_count": submission.comment_count,
+            "post_type": post_type.value,
+            "content": get_content(submission),
+        }
+    
+    def _build_comment_dict(self, comment, parent_id: Optional[str], depth: int) -> dict:
+        """Convert redditwarp comment to a dict shaped like the Comment model."""
+        return {
+            "id": comment.id36,
+            "parent_id": parent_id,
+            "depth": depth,
+            "author": comment.author_display_name or '[deleted]',
+            "body": comment.body,
+            "score": comment.score,
+        }
+    
+    def _flatten_comment_tree(self, nodes, depth: int = DEFAULT_COMMENT_DEPTH) -> list[dict]:
+        """Flatten comment trees into a list in thread order, with depth limit.
+        
+        Each comment records its parent_id and depth instead of nesting its replies,
+        so clients can rebuild the tree in a single pass if they need it. A comment that
+        fails to build is skipped along with its replies, rather than failing the
+        whole response.
+        """
+        comments = []
+        # Reversed so comments are popped, and emitted, in their original order
+        stack = [(node, None, 0) for node in reversed(nodes)] if depth > 0 else []
+        while stack:
+            node, parent_id, level = stack.pop()
+            comment = node.value
+            # Read inside the guard too, so a broken id can't escape it while logging
+            comment_id = "<unknown>"
+            try:
+                comment_id = comment.id36
+                comments.append(self._build_comment_dict(comment, parent_id, level))
+            except Exception as e:
+                logger.warning("Skipping comment %s: %s", comment_id, e)
+                continue
+            if level + 1 < depth:
+                stack.extend((child, comment_id, level + 1) for child in reversed(node.children))
+        return comments
+    
+    async def get_frontpage_posts(self, limit: int = 10) -> list[dict]:
         """Get hot posts from Reddit frontpage."""
         try:
-            posts = []
-            for subm in self.client.p.front.pull.hot(limit):
-                posts.append(self._build_post(subm))
-            return posts
+            return await self._get_posts(("frontpage", limit), lambda: self.client.p.front.pull.hot(limit))
         except Exception as e:
             raise ValueError(f"Failed to fetch frontpage posts: {str(e)}")
     
-    def get_subreddit_info(self, subreddit_name: str) -> SubredditInfo:
+    async def get_subreddit_info(self, subreddit_name: str) -> dict:
         """Get basic information about a subreddit."""
         try:
-            subr = self.client.p.subreddit.fetch_by_name(subreddit_name)
-            return SubredditInfo(
-                name=subr.name,
-                subscriber_count=subr.subscriber_count,
-                description=subr.public_description
-            )
+            async def fetch_info() -> dict:
+                subr = await self._request(lambda: self.client.p.subreddit.fetch_by_name(subreddit_name))
+                return {
+                    "name": subr.name,
+                    "subscriber_count": subr.subscriber_count,
+                    "description": subr.public_description,
+                }
+
+            return await self._single_flight(("info", subreddit_name.lower()), fetch_info)
         except Exception as e:
             raise ValueError(f"Failed to fetch subreddit info for '{subreddit_name}': {str(e)}")
     
-    def get_subreddit_hot_posts(self, subreddit_name: str, limit: int = 10) -> list[Post]:
+    async def get_subreddit_hot_posts(self, subreddit_name: str, limit: int = 10) -> list[dict]:
         """Get hot posts from a specific subreddit."""
         try:
-            posts = []
-            for subm in self.client.p.subreddit.pull.hot(subreddit_name, limit):
-                posts.append(self._build_post(subm))
-            return posts
+            return await self._get_posts(
+                ("hot", subreddit_name.lower(), limit),
+                lambda: self.client.p.subreddit.pull.hot(subreddit_name, limit),
+            )
         except Exception as e:
             raise ValueError(f"Failed to fetch hot posts from '{subreddit_name}': {str(e)}")
     
-    def get_subreddit_new_posts(self, subreddit_name: str, limit: int = 10) -> list[Post]:
+    async def get_subreddit_new_posts(self, subreddit_name: str, limit: int = 10) -> list[dict]:
         """Get new posts from a specific subreddit."""
         try:
-            posts = []
-            for subm in self.client.p.subreddit.pull.new(subreddit_name, limit):
-                posts.append(self._build_post(subm))
-            return posts
+            return await self._get_posts(
+                ("new", subreddit_name.lower(), limit),
+                lambda: self.client.p.subreddit.pull.new(subreddit_name, limit),
+            )
         except Exception as e:
             raise ValueError(f"Failed to fetch new posts from '{subreddit_name}': {str(e)}")
     
-    def get_subreddit_top_posts(self, subreddit_name: str, limit: int = 10, time: str = "") -> list[Post]:
+    async def get_subreddit_top_posts(self, subreddit_name: str, limit: int = 10, time: str = "") -> list[dict]:
         """Get top posts from a specific subreddit."""
         try:
-            posts = []
-            for subm in self.client.p.subreddit.pull.top(subreddit_name, limit, time=time):
-                posts.append(self._build_post(subm))
-            return posts
+            return await self._get_posts(
+                ("top", subreddit_name.lower(), limit, time),
+                lambda: self.client.p.subreddit.pull.top(subreddit_name, limit, time=time),
+            )
         except Exception as e:
             raise ValueError(f"Failed to fetch top posts from '{subreddit_name}': {str(e)}")
     
-    def get_subreddit_rising_posts(self, subreddit_name: str, limit: int = 10) -> list[Post]:
+    async def get_subreddit_rising_posts(self, subreddit_name: str, limit: int = 10) -> list[dict]:
         """Get rising posts from a specific subreddit."""
         try:
-            posts = []
-            for subm in self.client.p.subreddit.pull.rising(subreddit_name, limit):
-                posts.append(self._build_post(subm))
-            return posts
+            return await self._get_posts(
+                ("rising", subreddit_name.lower(), limit),
+                lambda: self.client.p.subreddit.pull.rising(subreddit_name, limit),
+            )
         except Exception as e:
             raise ValueError(f"Failed to fetch rising posts from '{subreddit_name}': {str(e)}")
     
-    def get_post_content(self, post_id: str, comment_limit: int = 10, comment_depth: int = 3) -> PostDetail:
+    async def get_post_content(
+        self, post_id: str, comment_limit: int = DEFAULT_COMMENT_LIMIT, comment_depth: int = DEFAULT_COMMENT_DEPTH
+    ) -> dict:
         """Get detailed post content including comments."""
         try:
-            submission = self.client.p.submission.fetch(post_id)
-            post = self._build_post(submission)
-            
-            # Fetch comments
-            comments = self.get_post_comments(post_id, comment_limit)
-            
-            return PostDetail(post=post, comments=comments)
+            # Submission and comment tree are independent requests, so fetch them concurrently
+            submission, comments = await asyncio.gather(
+                self._request(lambda: self.client.p.submission.fetch(post_id)),
+                self.get_post_comments(post_id, comment_limit, comment_depth),
+            )
+            return {"post": self._build_post_dict(submission), "comments": comments}
         except Exception as e:
             raise ValueError(f"Failed to fetch post content for '{post_id}': {str(e)}")
     
-    def get_post_comments(self, post_id: str, limit: int = 10) -> list[Comment]:
+    async def get_post_comments(
+        self, post_id: str, limit: int = DEFAULT_COMMENT_LIMIT, depth: int = DEFAULT_COMMENT_DEPTH
+    ) -> list[dict]:
         """Get comments from a post."""
-        try:
-            comments = []
-            tree_node = self.client.p.comment_tree.fetch(post_id, sort='top', limit=limit)
-            for node in tree_node.children:
-                comment = self._build_comment_tree(node)
-                if comment:
-                    comments.append(comment)
+        key = ("comments", post_id, limit, depth)
+        task = self._prefetching.pop(key, None)
+        if task is not None:
+            # Shielded so a cancelled caller doesn't cancel a fetch it didn't start
+            comments = await asyncio.shield(task)
+        else:
+            comments = self._prefetched.pop(key)
+        if comments is not None:
             return comments
+        return await self._fetch_comments(post_id, limit, depth)
+    
+    async def _fetch_comments(self, post_id: str, limit: int, depth: int) -> list[dict]:
+        """Fetch and build a post's comment tree."""
+        try:
+            # Ask Reddit for exactly the levels we render so the whole tree arrives inline
+            # in one response, rather than as deeper levels that would need expanding later
+            tree_node = await self._request(
+                lambda: self.client.p.comment_tree.fetch(post_id, sort='top', limit=limit, depth=depth)
+            )
+            return self._flatten_comment_tree(tree_node.children, depth)
         except Exception as e:
             raise ValueError(f"Failed to fetch comments for post '{post_id}': {str(e)}")
 
 
+@functools.lru_cache(maxsize=1)
+def _get_server() -> RedditServer:
+    """Return the shared RedditServer so the client's connection pool is reused across tool calls."""
+    from redditwarp.http.transport.reg_ASYNC import set_transport_adapter_module
+
+    # Process-wide, so it is set once here, before the only client is built
+    set_transport_adapter_module(PooledHttpxTransport("pooled_httpx_transport"))
+    return RedditServer()
+
+
 # FastMCP Tool Definitions
 @mcp.tool()
-def get_frontpage_posts(limit: int = Field(default=10, ge=1, le=100)) -> list[dict]:
+async def get_frontpage_posts(limit: int = Field(default=10, ge=1, le=100)) -> list[dict]:
     """Get hot posts from Reddit frontpage.
     
     Args:
@@ -246,13 +485,12 @@ def get_frontpage_posts(limit: int = Field(default=10, ge=1, le=100)) -> list[di
     Returns:
         List of frontpage posts with title, author, score, etc.
     """
-    reddit_server = RedditServer()
-    posts = reddit_server.get_frontpage_posts(limit)
-    return [post.model_dump() for post in posts]
+    reddit_server = _get_server()
+    return await reddit_server.get_frontpage_posts(limit)
 
 
 @mcp.tool()
-def get_subreddit_info(subreddit_name: str) -> dict:
+async def get_subreddit_info(subreddit_name: str) -> dict:
     """Get basic information about a subreddit.
     
     Args:
@@ -261,13 +499,12 @@ def get_subreddit_info(subreddit_name: str) -> dict:
     Returns:
         Subreddit information including name, subscriber count, and description
     """
-    reddit_server = RedditServer()
-    info = reddit_server.get_subreddit_info(subreddit_name)
-    return info.model_dump()
+    reddit_server = _get_server()
+    return await reddit_server.get_subreddit_info(subreddit_name)
 
 
 @mcp.tool()
-def get_subreddit_hot_posts(subreddit_name: str, limit: int = Field(default=10, ge=1, le=100)) -> list[dict]:
+async def get_subreddit_hot_posts(subreddit_name: str, limit: int = Field(default=10, ge=1, le=100)) -> list[dict]:
     """Get hot posts from a specific subreddit.
     
     Args:
@@ -277,13 +514,12 @@ def get_subreddit_hot_posts(subreddit_name: str, limit: int = Field(default=10,
     Returns:
         List of hot posts from the subreddit
     """
-    reddit_server = RedditServer()
-    posts = reddit_server.get_subreddit_hot_posts(subreddit_name, limit)
-    return [post.model_dump() for post in posts]
+    reddit_server = _get_server()
+    return await reddit_server.get_subreddit_hot_posts(subreddit_name, limit)
 
 
 @mcp.tool()
-def get_subreddit_new_posts(subreddit_name: str, limit: int = Field(default=10, ge=1, le=100)) -> list[dict]:
+async def get_subreddit_new_posts(subreddit_name: str, limit: int = Field(default=10, ge=1, le=100)) -> list[dict]:
     """Get new posts from a specific subreddit.
     
     Args:
@@ -293,16 +529,15 @@ def get_subreddit_new_posts(subreddit_name: str, limit: int = Field(default=10,
     Returns:
         List of new posts from the subreddit
     """
-    reddit_server = RedditServer()
-    posts = reddit_server.get_subreddit_new_posts(subreddit_name, limit)
-    return [post.model_dump() for post in posts]
+    reddit_server = _get_server()
+    return await reddit_server.get_subreddit_new_posts(subreddit_name, limit)
 
 
 @mcp.tool()
-def get_subreddit_top_posts(
+async def get_subreddit_top_posts(
     subreddit_name: str, 
     limit: int = Field(default=10, ge=1, le=100),
-    time: str = Field(default="", pattern="^(|hour|day|week|month|year|all)$")
+    time: Literal["", "hour", "day", "week", "month", "year", "all"] = ""
 ) -> list[dict]:
     """Get top posts from a specific subreddit.
     
@@ -314,13 +549,12 @@ def get_subreddit_top_posts(
     Returns:
         List of top posts from the subreddit
     """
-    reddit_server = RedditServer()
-    posts = reddit_server.get_subreddit_top_posts(subreddit_name, limit, time)
-    return [post.model_dump() for post in posts]
+    reddit_server = _get_server()
+    return await reddit_server.get_subreddit_top_posts(subreddit_name, limit, time)
 
 
 @mcp.tool()
-def get_subreddit_rising_posts(subreddit_name: str, limit: int = Field(default=10, ge=1, le=100)) -> list[dict]:
+async def get_subreddit_rising_posts(subreddit_name: str, limit: int = Field(default=10, ge=1, le=100)) -> list[dict]:
     """Get rising posts from a specific subreddit.
     
     Args:
@@ -330,16 +564,15 @@ def get_subreddit_rising_posts(subreddit_name: str, limit: int = Field(default=1
     Returns:
         List of rising posts from the subreddit
     """
-    reddit_server = RedditServer()
-    posts = reddit_server.get_subreddit_rising_posts(subreddit_name, limit)
-    return [post.model_dump() for post in posts]
+    reddit_server = _get_server()
+    return await reddit_server.get_subreddit_rising_posts(subreddit_name, limit)
 
 
 @mcp.tool()
-def get_post_content(
+async def get_post_content(
     post_id: str,
-    comment_limit: int = Field(default=10, ge=1, le=100),
-    comment_depth: int = Field(default=3, ge=1, le=10)
+    comment_limit: int = Field(default=DEFAULT_COMMENT_LIMIT, ge=1, le=100),
+    comment_depth: int = Field(default=DEFAULT_COMMENT_DEPTH, ge=1, le=10)
 ) -> dict:
     """Get detailed post content including comments.
     
@@ -349,15 +582,14 @@ def get_post_content(
         comment_depth: Maximum depth of comment replies to fetch (1-10, default 3)
         
     Returns:
-        Detailed post information with nested comments
+        Detailed post information with comments in thread order, each linked to its parent by parent_id
     """
-    reddit_server = RedditServer()
-    detail = reddit_server.get_post_content(post_id, comment_limit, comment_depth)
-    return detail.model_dump()
+    reddit_server = _get_server()
+    return await reddit_server.get_post_content(post_id, comment_limit, comment_depth)
 
 
 @mcp.tool()
-def get_post_comments(post_id: str, limit: int = Field(default=10, ge=1, le=100)) -> list[dict]:
+async def get_post_comments(post_id: str, limit: int = Field(default=DEFAULT_COMMENT_LIMIT, ge=1, le=100)) -> list[dict]:
     """Get comments from a post.
     
     Args:
@@ -365,11 +597,10 @@ def get_post_comments(post_id: str, limit: int = Field(default=10, ge=1, le=100)
         limit: Number of comments to retrieve (1-100, default 10)
         
     Returns:
-        List of comments from the post
+        List of comments from the post in thread order, each linked to its parent by parent_id
     """
-    reddit_server = RedditServer()
-    comments = reddit_server.get_post_comments(post_id, limit)
-    return [comment.model_dump() for comment in comments]
+    reddit_server = _get_server()
+    return await reddit_server.get_post_comments(post_id, limit)
 
 
 def parse_arguments():
@@ -388,9 +619,13 @@ def parse_arguments():
 
 def main():
     """Main entry point for the Reddit MCP server."""
+    global PREFETCH_ENABLED
     args = parse_arguments()
     
     if args.transport == 'streamable-http':
+        PREFETCH_ENABLED = True
+        # Build the shared client up front so the first request doesn't pay for it
+        _get_server()
         # Run as HTTP server for remote access
         mcp.run(transport="streamable-http", host=args.host, port=args.port)
     else: